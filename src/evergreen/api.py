@@ -2,20 +2,38 @@
 """API for interacting with evergreen."""
 from __future__ import absolute_import
 
+import copy
 import json
 import re
 import subprocess
-from contextlib import contextmanager
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing, contextmanager
 from datetime import datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from http import HTTPStatus
+from itertools import chain
 from json.decoder import JSONDecodeError
 from time import time
-from typing import Any, Callable, Dict, Generator, Iterable, Iterator, List, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Union,
+    cast,
+)
 
 import requests
 import structlog
 from requests.exceptions import HTTPError
+from requests.structures import CaseInsensitiveDict
 from structlog.stdlib import LoggerFactory
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
@@ -60,15 +78,47 @@ except ImportError:
 LOGGER = structlog.getLogger(__name__)
 
 CACHE_SIZE = 5000
+ETAG_CACHE_SIZE = 500
 DEFAULT_LIMIT = 100
+DEFAULT_PAGE_SIZE = 1000
 MAX_RETRIES = 3
 START_WAIT_TIME_SEC = 2
 MAX_WAIT_TIME_SEC = 5
+# Connection pool sizing for the API server adapter. Large enough that threaded callers sharing
+# a session via `with_session` don't discard connections when they fan out requests.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+DEFAULT_MAX_WORKERS = 16
 
 EVERGREEN_URL_REGEX = re.compile(r"(https?)://evergreen\..*?(?=\\n)")
 EVERGREEN_PATCH_ID_REGEX = re.compile(r"(?<=ID : )\w{24}")
 
 
+def _prefetch(fn: Callable[..., Any], *args: Any) -> Future:
+    """
+    Start calling fn with the given args in the background.
+
+    Every call gets its own daemon thread, so prefetches never queue behind each other and one
+    that is still in flight does not keep the interpreter from exiting.
+
+    :param fn: Function to call.
+    :param args: Arguments to call fn with.
+    :return: Future for the result of the call.
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except Exception as err:
+            future.set_exception(err)
+
+    threading.Thread(target=run, name="evergreen-prefetch", daemon=True).start()
+    return future
+
+
 class EvergreenApi(object):
     """Base methods for building API objects."""
 
@@ -93,6 +143,9 @@ class EvergreenApi(object):
         """
         self._timeout = timeout
         self._api_server = api_server
+        self._rest_base_url = f"{api_server}/rest/v2"
+        self._plugin_base_url = f"{api_server}/plugin/json"
+        self._api_scheme = urlparse(api_server).scheme
         self._auth = auth
         self._session = session
         self._log_on_error = log_on_error
@@ -124,13 +177,18 @@ class EvergreenApi(object):
     def _create_session(self) -> requests.Session:
         """Create a new session to query the API with."""
         session = requests.Session()
-        adapter = requests.adapters.HTTPAdapter()
-        session.mount(f"{urlparse(self._api_server).scheme}://", adapter)
+        session.mount(f"{self._api_scheme}://", self._create_adapter())
         auth = self._auth
         if auth:
             session.headers.update({"Api-User": auth.username, "Api-Key": auth.api_key})
         return session
 
+    def _create_adapter(self) -> requests.adapters.HTTPAdapter:
+        """Create the adapter used to send requests to the API server."""
+        return requests.adapters.HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+        )
+
     def _create_url(self, endpoint: str) -> str:
         """
         Format a call to a v2 REST API endpoint.
@@ -138,7 +196,7 @@ class EvergreenApi(object):
         :param endpoint: endpoint to call.
         :return: Full url to get endpoint.
         """
-        return f"{self._api_server}/rest/v2{endpoint}"
+        return self._rest_base_url + endpoint
 
     def _create_plugin_url(self, endpoint: str) -> str:
         """
@@ -147,7 +205,7 @@ class EvergreenApi(object):
         :param endpoint: endpoint to call.
         :return: Full url to get endpoint.
         """
-        return f"{self._api_server}/plugin/json{endpoint}"
+        return self._plugin_base_url + endpoint
 
     @staticmethod
     def _log_api_call_time(response: requests.Response, start_time: float) -> None:
@@ -240,9 +298,15 @@ class EvergreenApi(object):
 
         :param response: response from evergreen api.
         """
-        try:
-            json_data = response.json()
-            if response.status_code >= 400 and "error" in json_data:
+        if response.status_code < 400:
+            return
+
+        if "json" in response.headers.get("Content-Type", ""):
+            try:
+                json_data = response.json()
+            except JSONDecodeError:
+                json_data = None
+            if json_data and "error" in json_data:
                 if self._log_on_error:
                     LOGGER.error(
                         "Error found in json",
@@ -253,31 +317,120 @@ class EvergreenApi(object):
                         response_text=response.text,
                     )
                 raise requests.exceptions.HTTPError(json_data["error"], response=response)
-        except JSONDecodeError:
-            pass
 
         response.raise_for_status()
 
     def _paginate(
-        self, url: str, params: Optional[Dict] = None
+        self, url: str, params: Optional[Dict] = None, page_size: Optional[int] = None
     ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """
         Paginate until all results are returned and return a list of all JSON results.
 
+        A "limit" in params caps the number of results returned. If no limit is given,
+        page_size is sent as the limit instead so fewer requests are needed to get all results.
+
         :param url: url to make request to.
         :param params: parameters to pass to request.
+        :param page_size: number of results to request per page if params has no limit.
         :return: json list of all results.
         """
-        response = self._call_api(url, params)
-        json_data = response.json()
-        while "next" in response.links:
-            if params and "limit" in params and len(json_data) >= params["limit"]:
-                break
-            response = self._call_api(response.links["next"]["url"])
-            if response.json():
-                json_data.extend(response.json())
+        limit = params.get("limit") if params else None
+        if limit is None and page_size is not None:
+            params = {**(params or {}), "limit": page_size}
+        # Without a limit every page will be needed, so the next one can be fetched while the
+        # current one is decoded.
+        pages = self._iterate_pages(url, params, repeat_params=False, prefetch=limit is None)
+        with closing(pages):
+            json_pages = [next(pages).json()]
+            result_count = len(json_pages[0]) if limit is not None else 0
+            while limit is None or result_count < limit:
+                response = next(pages, None)
+                if response is None:
+                    break
+                page = response.json()
+                if page:
+                    json_pages.append(page)
+                    result_count += len(page)
+
+        if len(json_pages) == 1:
+            return json_pages[0]
+        return list(chain.from_iterable(json_pages))
+
+    def _iterate_pages(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        repeat_params: bool = True,
+        prefetch: bool = False,
+    ) -> Generator[requests.Response, None, None]:
+        """
+        Iterate over the responses of a paginated endpoint.
+
+        All pages are requested over the same session. When prefetching, the next page is
+        requested in the background as soon as its url is known, so the round trip overlaps with
+        the caller processing the current page.
+
+        :param url: URL to query.
+        :param params: Params to pass to the first page request.
+        :param repeat_params: Pass params to the requests for subsequent pages as well.
+        :param prefetch: Request the next page before the current one has been processed.
+        :return: A generator of the responses for each page.
+        """
+        next_params = params if repeat_params else None
+        # Send every page over one session so its connection is reused for the whole walk.
+        with self._client_with_shared_session() as api:
+            response = api._call_api(url, params)
+            while True:
+                # Response.links parses the Link header on every access, so only read it once.
+                links = response.links
+                next_url = links["next"]["url"] if "next" in links else None
+                next_page: Optional[Future] = None
+                if prefetch and next_url is not None:
+                    next_page = _prefetch(api._call_api, next_url, next_params)
+                yield response
+                if next_url is None:
+                    return
+                if next_page is not None:
+                    response = next_page.result()
+                else:
+                    response = api._call_api(next_url, next_params)
+
+    @contextmanager
+    def _client_with_shared_session(self) -> Generator["EvergreenApi", None, None]:
+        """
+        Yield a client that sends all of its requests over one session.
+
+        If this client has no shared session, a copy of it with a new session is yielded and that
+        session is closed once the caller is done with it.
+        """
+        if self._session is not None:
+            yield self
+            return
+
+        api = copy.copy(self)
+        api._session = self._create_session()
+        try:
+            yield api
+        finally:
+            api.session.close()
+
+    def _map_concurrently(
+        self, fn: Callable[["EvergreenApi", str], Any], ids: Iterable[str], max_workers: int
+    ) -> List[Any]:
+        """
+        Call fn with each of the given ids concurrently, sending all requests over one session.
 
-        return json_data
+        fn is given the client to send its requests with. That client may be a copy whose session
+        is closed once all calls are done, so the results should not refer to it.
+
+        :param fn: Function to call with the client to use and each id.
+        :param ids: Ids to call fn with.
+        :param max_workers: Maximum number of calls to have in flight at once.
+        :return: Results of each call, in the same order as ids.
+        """
+        with self._client_with_shared_session() as api:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(partial(fn, api), ids))
 
     def _lazy_paginate(self, url: str, params: Optional[Dict] = None) -> Iterable:
         """
@@ -292,18 +445,14 @@ class EvergreenApi(object):
                 "limit": DEFAULT_LIMIT,
             }
 
-        next_url = url
-        while True:
-            response = self._call_api(next_url, params)
+        # Lazy callers often stop early, so a page is only requested once the previous one has
+        # been consumed.
+        for response in self._iterate_pages(url, params):
             json_response = response.json()
             if not json_response:
                 break
             for result in json_response:
                 yield result
-            if "next" not in response.links:
-                break
-
-            next_url = response.links["next"]["url"]
 
     def _lazy_paginate_by_date(self, url: str, params: Optional[Dict] = None) -> Iterable:
         """
@@ -348,9 +497,26 @@ class EvergreenApi(object):
             params["status"] = status
 
         url = self._create_url("/hosts")
-        host_list = self._paginate(url, params)
+        host_list = self._paginate(url, params, page_size=DEFAULT_PAGE_SIZE)
         return [Host(host, self) for host in host_list]  # type: ignore[arg-type]
 
+    def all_hosts_iter(self, status: Optional[str] = None) -> Iterable[Host]:
+        """
+        Get all hosts in evergreen lazily.
+
+        Hosts are fetched a page at a time, so callers that only need to scan the hosts once do
+        not need to hold all of them in memory.
+
+        :param status: Only return hosts with specified status.
+        :return: Generator of all hosts in evergreen.
+        """
+        params: Dict[str, Any] = {"limit": DEFAULT_PAGE_SIZE}
+        if status is not None:
+            params["status"] = status
+
+        url = self._create_url("/hosts")
+        return (Host(host, self) for host in self._lazy_paginate(url, params))
+
     def host_by_id(self, host_id: str) -> Host:
         """
         Get evergreen host by id.
@@ -405,7 +571,7 @@ class EvergreenApi(object):
         :return: List of all projects in evergreen.
         """
         url = self._create_url("/projects")
-        project_list = self._paginate(url)
+        project_list = self._paginate(url, page_size=DEFAULT_PAGE_SIZE)
         projects = [Project(project, self) for project in project_list]  # type: ignore[arg-type]
         if project_filter_fn is not None:
             return [project for project in projects if project_filter_fn(project)]
@@ -896,6 +1062,23 @@ class EvergreenApi(object):
         url = self._create_url(f"/builds/{build_id}")
         return Build(self._paginate(url), self)  # type: ignore[arg-type]
 
+    def builds_by_ids(
+        self, build_ids: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> List[Build]:
+        """
+        Get several builds by id, querying for them concurrently.
+
+        :param build_ids: build ids to query.
+        :param max_workers: Maximum number of requests to have in flight at once.
+        :return: Builds queried for, in the same order as build_ids.
+        """
+        build_list = self._map_concurrently(
+            lambda api, build_id: api._paginate(api._create_url(f"/builds/{build_id}")),
+            build_ids,
+            max_workers,
+        )
+        return [Build(build, self) for build in build_list]  # type: ignore[arg-type]
+
     def tasks_by_build(
         self, build_id: str, fetch_all_executions: Optional[bool] = None
     ) -> List[Task]:
@@ -914,6 +1097,33 @@ class EvergreenApi(object):
         task_list = self._paginate(url, params)
         return [Task(task, self) for task in task_list]  # type: ignore[arg-type]
 
+    def tasks_by_build_ids(
+        self,
+        build_ids: Iterable[str],
+        fetch_all_executions: Optional[bool] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> List[List[Task]]:
+        """
+        Get all tasks for several builds, querying for them concurrently.
+
+        :param build_ids: build ids to query.
+        :param fetch_all_executions: Fetch all executions for a given task.
+        :param max_workers: Maximum number of requests to have in flight at once.
+        :return: List of tasks for each build, in the same order as build_ids.
+        """
+        params = {}
+        if fetch_all_executions:
+            params["fetch_all_executions"] = 1
+
+        task_lists = self._map_concurrently(
+            lambda api, build_id: api._paginate(
+                api._create_url(f"/builds/{build_id}/tasks"), params
+            ),
+            build_ids,
+            max_workers,
+        )
+        return [[Task(task, self) for task in task_list] for task_list in task_lists]
+
     def version_by_id(self, version_id: str) -> Version:
         """
         Get version by version id.
@@ -924,6 +1134,23 @@ class EvergreenApi(object):
         url = self._create_url(f"/versions/{version_id}")
         return Version(self._paginate(url), self)  # type: ignore[arg-type]
 
+    def versions_by_ids(
+        self, version_ids: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> List[Version]:
+        """
+        Get several versions by id, querying for them concurrently.
+
+        :param version_ids: Ids of versions to query.
+        :param max_workers: Maximum number of requests to have in flight at once.
+        :return: Versions queried for, in the same order as version_ids.
+        """
+        version_list = self._map_concurrently(
+            lambda api, version_id: api._paginate(api._create_url(f"/versions/{version_id}")),
+            version_ids,
+            max_workers,
+        )
+        return [Version(version, self) for version in version_list]  # type: ignore[arg-type]
+
     def builds_by_version(self, version_id: str, params: Optional[Dict] = None) -> List[Build]:
         """
         Get all builds for a given Evergreen version_id.
@@ -1501,8 +1728,163 @@ class EvergreenApi(object):
         return kwargs
 
 
+class _CachedResponse(NamedTuple):
+    """The parts of a GET response needed to answer a later request from the cache."""
+
+    etag: str
+    status_code: int
+    reason: str
+    headers: Dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "_CachedResponse":
+        """
+        Copy the data out of the given response.
+
+        The response itself is not kept, since it references the adapter and connection it was
+        received on.
+
+        :param response: Response to copy.
+        :return: Data needed to rebuild the response.
+        """
+        return cls(
+            etag=response.headers["ETag"],
+            status_code=response.status_code,
+            reason=response.reason,
+            headers=dict(response.headers),
+            content=response.content,
+            encoding=response.encoding,
+        )
+
+    def to_response(self, request: requests.PreparedRequest) -> requests.Response:
+        """
+        Build a new response from the cached data.
+
+        :param request: Request the response answers.
+        :return: Response equivalent to the one originally received.
+        """
+        response = requests.Response()
+        response.status_code = self.status_code
+        response.reason = self.reason
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content
+        response._content_consumed = True  # type: ignore[attr-defined]
+        response.encoding = self.encoding
+        response.url = request.url  # type: ignore[assignment]
+        response.request = request
+        return response
+
+
+class _ETagCache(object):
+    """Bounded cache of GET responses that carried an ETag, keyed by url."""
+
+    def __init__(self, max_size: int) -> None:
+        """
+        Create an empty cache.
+
+        :param max_size: Maximum number of responses to keep.
+        """
+        self._max_size = max_size
+        self._responses: "OrderedDict[str, _CachedResponse]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[_CachedResponse]:
+        """
+        Get the cached response for the given url.
+
+        :param url: Url the response was returned for.
+        :return: Cached response if there is one.
+        """
+        with self._lock:
+            response = self._responses.get(url)
+            if response is not None:
+                self._responses.move_to_end(url)
+            return response
+
+    def put(self, url: str, response: _CachedResponse) -> None:
+        """
+        Cache a response, evicting the least recently used one if the cache is full.
+
+        :param url: Url the response was returned for.
+        :param response: Response to cache.
+        """
+        with self._lock:
+            self._responses[url] = response
+            self._responses.move_to_end(url)
+            while len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._responses.clear()
+
+
+class _ETagCachingAdapter(requests.adapters.HTTPAdapter):
+    """
+    HTTP adapter that revalidates cached GET responses with the server by their ETag.
+
+    Only JSON responses to urls under the given prefix are cached, so large text bodies from the
+    same host, such as task logs and patch diffs, are not kept in memory.
+    """
+
+    def __init__(self, cache: _ETagCache, url_prefix: str, **kwargs: Any) -> None:
+        """
+        Create an adapter backed by the given cache.
+
+        :param cache: Cache of responses to revalidate.
+        :param url_prefix: Only cache responses to urls that start with this prefix.
+        :param kwargs: Arguments to pass to HTTPAdapter.
+        """
+        super(_ETagCachingAdapter, self).__init__(**kwargs)
+        self._cache = cache
+        self._url_prefix = url_prefix
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send the request, answering it from the cache if the server reports it is unchanged.
+
+        :param request: Request to send.
+        :param kwargs: Arguments to pass to HTTPAdapter.send.
+        :return: Response to the request.
+        """
+        if (
+            request.method != "GET"
+            or kwargs.get("stream")
+            or request.url is None
+            or not request.url.startswith(self._url_prefix)
+        ):
+            return super(_ETagCachingAdapter, self).send(request, **kwargs)
+
+        cached = self._cache.get(request.url)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached.etag
+
+        response = super(_ETagCachingAdapter, self).send(request, **kwargs)
+        if cached is not None and response.status_code == HTTPStatus.NOT_MODIFIED:
+            response.close()
+            return cached.to_response(request)
+
+        if (
+            response.status_code == HTTPStatus.OK
+            and "ETag" in response.headers
+            and "json" in response.headers.get("Content-Type", "")
+        ):
+            self._cache.put(request.url, _CachedResponse.from_response(response))
+        return response
+
+
 class CachedEvergreenApi(EvergreenApi):
-    """Access to the Evergreen API server that caches certain calls."""
+    """
+    Access to the Evergreen API server that caches certain calls.
+
+    JSON responses from the REST API that carry an ETag are also kept and revalidated with the
+    server on later requests, so unchanged results are not downloaded again.
+    """
 
     def __init__(
         self,
@@ -1515,6 +1897,16 @@ class CachedEvergreenApi(EvergreenApi):
         super(CachedEvergreenApi, self).__init__(
             api_server, auth, timeout, log_on_error=log_on_error
         )
+        self._etag_cache = _ETagCache(ETAG_CACHE_SIZE)
+
+    def _create_adapter(self) -> requests.adapters.HTTPAdapter:
+        """Create an adapter that revalidates responses in the client's ETag cache."""
+        return _ETagCachingAdapter(
+            self._etag_cache,
+            self._rest_base_url,
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+        )
 
     @lru_cache(maxsize=CACHE_SIZE)
     def build_by_id(self, build_id: str) -> Build:  # type: ignore[override]
@@ -1560,6 +1952,7 @@ class CachedEvergreenApi(EvergreenApi):
         ]
         for fn in cached_functions:
             fn.cache_clear()  # type: ignore[attr-defined]
+        self._etag_cache.clear()
 
 
 class RetryingEvergreenApi(EvergreenApi):
@@ -64,7 +64,14 @@ def evg_date_attrib(attrib_name: str) -> property:
 
 
 class _BaseEvergreenObject(object):
-    """Common evergreen object."""
+    """
+    Common evergreen object.
+
+    The most common subclasses define __slots__, so attributes that are not declared on the class
+    cannot be set on their instances.
+    """
+
+    __slots__ = ("json", "_api", "_date_fields", "__weakref__")
 
     def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
         """Create an instance of an evergreen task."""
@@ -72,6 +79,21 @@ class _BaseEvergreenObject(object):
         self._api = api
         self._date_fields = None
 
+    def __setstate__(self, state: Any) -> None:
+        """
+        Restore the attributes of an unpickled object.
+
+        Objects pickled before their class defined __slots__ have their attributes stored in a
+        dict, so both that and the (dict, slots) state of slotted objects are accepted.
+
+        :param state: Pickled state of the object.
+        """
+        if isinstance(state, tuple):
+            dict_state, slot_state = state
+            state = {**(dict_state or {}), **(slot_state or {})}
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def _is_field_a_date(self, item: str) -> bool:
         """
         Determine if given field is a date.
@@ -2,13 +2,12 @@
 """Representation of an evergreen build."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
 from evergreen.metrics.buildmetrics import BuildMetrics
 
 if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
     from evergreen.task import Task  # noqa: F401
     from evergreen.version import Version
 
@@ -33,19 +32,12 @@ class StatusCounts(_BaseEvergreenObject):
     dispatched = evg_attrib("dispatched")
     timed_out = evg_attrib("timed_out")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create a Status Counts object.
-
-        :param json: Json of status counts object.
-        :param api: Evergreen API.
-        """
-        super(StatusCounts, self).__init__(json, api)
-
 
 class Build(_BaseEvergreenObject):
     """Representation of an Evergreen build."""
 
+    __slots__ = ()
+
     id = evg_attrib("_id")
     project_id = evg_attrib("project_id")
     project_identifier = evg_attrib("project_identifier")
@@ -68,15 +60,6 @@ class Build(_BaseEvergreenObject):
     actual_makespan_ms = evg_attrib("actual_makespan_ms")
     origin = evg_attrib("origin")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of an evergreen task.
-
-        :param json: Json of build object.
-        :param api: Evergreen API.
-        """
-        super(Build, self).__init__(json, api)
-
     @property
     def status_counts(self) -> StatusCounts:
         """Get the status counts of the build."""
@@ -2,13 +2,10 @@
 """Commit Queue representation of evergreen."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import List
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class CommitQueueItem(_BaseEvergreenObject):
     """Representation of an entry in a commit queue."""
@@ -16,30 +13,12 @@ class CommitQueueItem(_BaseEvergreenObject):
     issue = evg_attrib("issue")
     modules = evg_attrib("modules")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create a CommitQueueItem object.
-
-        :param json: Commit queue item json.
-        :param api: Evergreen API.
-        """
-        super(CommitQueueItem, self).__init__(json, api)
-
 
 class CommitQueue(_BaseEvergreenObject):
     """Representation of a commit queue from evergreen."""
 
     queue_id = evg_attrib("queue_id")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a commit queue from evergreen json.
-
-        :param json: Evergreen json representation of commit queue.
-        :param api: Evergreen api object.
-        """
-        super(CommitQueue, self).__init__(json, api)
-
     @property
     def queue(self) -> List[CommitQueueItem]:
         """
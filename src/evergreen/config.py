@@ -2,11 +2,11 @@
 """Get configuration about connecting to evergreen."""
 from __future__ import absolute_import
 
+import copy
 import os
+import threading
 from collections import namedtuple
-from typing import Dict, Optional
-
-import yaml
+from typing import IO, Any, Dict, Optional, Tuple
 
 EvgAuth = namedtuple("EvgAuth", ["username", "api_key"])
 
@@ -17,16 +17,55 @@ CONFIG_FILE_LOCATIONS = [
     os.path.expanduser(os.path.join("~", ".evergreen.yml")),
 ]
 
+# Parsed config files keyed by real path, along with the (mtime_ns, size) they were parsed at.
+_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+_CONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _load_yaml(fstream: IO[str]) -> Any:
+    """
+    Parse the given yaml stream, using the libyaml backed loader if it is available.
+
+    yaml is imported here rather than at module level since it is only needed when a config
+    file is actually read.
+
+    :param fstream: Stream to parse.
+    :return: Parsed yaml.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader  # type: ignore
+
+    return yaml.load(fstream, Loader=Loader)
+
 
 def read_evergreen_from_file(filename: str) -> Dict:
     """
     Read evergreen config from given filename.
 
+    The parsed config is cached and only re-read when the file's modification time or size
+    changes. Callers get their own copy of the config and are free to modify it.
+
     :param filename: Filename to read config.
     :return: Config read from file.
     """
-    with open(filename, "r") as fstream:
-        return yaml.safe_load(fstream)
+    path = os.path.realpath(filename)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _CONFIG_CACHE_LOCK:
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[:2] == signature:
+            return copy.deepcopy(cached[2])
+
+    with open(path, "r") as fstream:
+        config = _load_yaml(fstream)
+
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE[path] = (*signature, config)
+    return copy.deepcopy(config)
 
 
 def read_evergreen_config() -> Optional[Dict]:
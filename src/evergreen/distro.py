@@ -22,28 +22,10 @@ class MountPoint(_BaseEvergreenObject):
     size = evg_attrib("size")
     virtual_name = evg_attrib("virtual_name")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of the mount point.
-
-        :param json: Json of mount point.
-        :param api: Evergreen API.
-        """
-        super(MountPoint, self).__init__(json, api)
-
 
 class StaticDistroSettings(_BaseEvergreenObject):
     """Representation of Evergreen static distro settings."""
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of the distro settings for static images.
-
-        :param json: Json of distro settings.
-        :param api: Evergreen API.
-        """
-        super(StaticDistroSettings, self).__init__(json, api)
-
     @property
     def hosts(self) -> List[str]:
         """
@@ -61,15 +43,6 @@ class DockerDistroSettings(_BaseEvergreenObject):
 
     image_url = evg_attrib("image_url")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of the distro settings for docker.
-
-        :param json: Json of distro settings.
-        :param api: Evergreen API.
-        """
-        super(DockerDistroSettings, self).__init__(json, api)
-
 
 class AwsDistroSettings(_BaseEvergreenObject):
     """Representation of AWS Distro Settings."""
@@ -89,15 +62,6 @@ class AwsDistroSettings(_BaseEvergreenObject):
     user_data = evg_attrib("user_data")
     vpc_name = evg_attrib("vpc_name")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of the distro settings.
-
-        :param json: Json of the distro settings.
-        :param api: Evergreen API.
-        """
-        super(AwsDistroSettings, self).__init__(json, api)
-
     @property
     def mount_points(self) -> List[MountPoint]:
         """
@@ -122,30 +86,12 @@ class PlannerSettings(_BaseEvergreenObject):
     patch_zipper_factor = evg_attrib("patch_zipper_factor")
     task_ordering = evg_attrib("task_ordering")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of planner settings for a distro.
-
-        :param json: planner settings json.
-        :param api: Evergreen API.
-        """
-        super(PlannerSettings, self).__init__(json, api)
-
 
 class FinderSettings(_BaseEvergreenObject):
     """Representation of finder settings."""
 
     version = evg_attrib("version")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of finder settings for a distro.
-
-        :param json: finder settings json.
-        :param api: Evergreen API.
-        """
-        super(FinderSettings, self).__init__(json, api)
-
 
 class Distro(_BaseEvergreenObject):
     """Representation of an Evergreen Distro."""
@@ -2,12 +2,11 @@
 """Host representation of evergreen."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
 
 if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
     from evergreen.build import Build
     from evergreen.version import Version
 
@@ -19,15 +18,6 @@ class HostDistro(_BaseEvergreenObject):
     provider = evg_attrib("provider")
     image_id = evg_attrib("image_id")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a distro.
-
-        :param json: json of distro.
-        :param api: Evergreen API.
-        """
-        super(HostDistro, self).__init__(json, api)
-
 
 class RunningTask(_BaseEvergreenObject):
     """Representation of a running task."""
@@ -38,15 +28,6 @@ class RunningTask(_BaseEvergreenObject):
     version_id = evg_attrib("version_id")
     build_id = evg_attrib("build_id")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a Running Task.
-
-        :param json: json of running task.
-        :param api: Evergreen API.
-        """
-        super(RunningTask, self).__init__(json, api)
-
     def get_build(self) -> "Build":
         """
         Get build for the running task.
@@ -67,6 +48,8 @@ class RunningTask(_BaseEvergreenObject):
 class Host(_BaseEvergreenObject):
     """Representation of an Evergreen host."""
 
+    __slots__ = ()
+
     host_id = evg_attrib("host_id")
     host_url = evg_attrib("host_url")
     provisioned = evg_attrib("provisioned")
@@ -76,10 +59,6 @@ class Host(_BaseEvergreenObject):
     status = evg_attrib("status")
     user_host = evg_attrib("user_host")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of an evergreen host."""
-        super(Host, self).__init__(json, api)
-
     @property
     def running_task(self) -> RunningTask:
         """Get the running task on this host."""
@@ -37,15 +37,6 @@ class Manifest(_BaseEvergreenObject):
     project = evg_attrib("project")
     branch = evg_attrib("branch")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of an evergreen version manifest.
-
-        :param json: json representing manifest.
-        :param api: evergreen api object.
-        """
-        super(Manifest, self).__init__(json, api)
-
     @property
     def modules(self) -> Optional[Dict[str, ManifestModule]]:
         """Map of modules in this manifest."""
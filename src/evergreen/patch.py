@@ -21,15 +21,6 @@ class GithubPatchData(_BaseEvergreenObject):
     head_hash = evg_attrib("head_hash")
     author = evg_attrib("author")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of github patch data.
-
-        :param json: json representing github patch data.
-        :param api: instance of evergreen api object.
-        """
-        super(GithubPatchData, self).__init__(json, api)
-
 
 class VariantsTasks(_BaseEvergreenObject):
     """Representation of a variants tasks object."""
@@ -68,15 +59,6 @@ class FileDiff(_BaseEvergreenObject):
     diff_link = evg_attrib("diff_link")
     description = evg_attrib("description")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a file diff.
-
-        :param json: JSON representing the data.
-        :param api: Pointer to the evergreen API client.
-        """
-        super().__init__(json, api)
-
 
 class ModuleCodeChanges(_BaseEvergreenObject):
     """Representation of the module code changes for a patch."""
@@ -86,15 +68,6 @@ class ModuleCodeChanges(_BaseEvergreenObject):
     raw_link = evg_attrib("raw_link")
     commit_messages = evg_attrib("commit_messages")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of the module code changes.
-
-        :param json: JSON representing the data.
-        :param api: Pointer to the evergreen API client.
-        """
-        super().__init__(json, api)
-
     @property
     def file_diffs(self) -> List[FileDiff]:
         """Retrieve a list of the file diffs for this patch."""
@@ -111,6 +84,8 @@ class PatchCreationDetails(NamedTuple):
 class Patch(_BaseEvergreenObject):
     """Representation of an Evergreen patch."""
 
+    __slots__ = ("_variants_tasks", "_variant_task_dict")
+
     patch_id = evg_attrib("patch_id")
     description = evg_attrib("description")
     project_id = evg_attrib("project_id")
@@ -19,10 +19,6 @@ class PerformanceTestResult(_BaseEvergreenObject):
     mean_value = evg_attrib("mean_value")
     measurement = evg_attrib("measurement")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a test result."""
-        super(PerformanceTestResult, self).__init__(json, api)
-
 
 class PerformanceTestRun(_BaseEvergreenObject):
     """Representation of a test run from Evergreen."""
@@ -103,10 +99,6 @@ class PerformanceData(_BaseEvergreenObject):
     tag = evg_attrib("tag")
     create_time = evg_short_datetime_attrib("create_time")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of performance data."""
-        super(PerformanceData, self).__init__(json, api)
-
     @property
     def test_batch(self) -> PerformanceTestBatch:
         """Get the performance test batch."""
@@ -2,18 +2,15 @@
 """Evergreen representation of a project."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Dict
-
 from evergreen.base import _BaseEvergreenObject, evg_attrib
 from evergreen.version import Version
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class Project(_BaseEvergreenObject):
     """Representation of an Evergreen project."""
 
+    __slots__ = ()
+
     batch_time = evg_attrib("batch_time")
     branch_name = evg_attrib("branch_name")
     display_name = evg_attrib("display_name")
@@ -31,15 +28,6 @@ class Project(_BaseEvergreenObject):
     pr_testing_enabled = evg_attrib("pr_testing_enabled")
     commit_queue = evg_attrib("commit_queue")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of an evergreen project.
-
-        :param json: json representing project.
-        :param api: evergreen api object.
-        """
-        super(Project, self).__init__(json, api)
-
     def __str__(self) -> str:
         """Get a string version of the Project."""
         return self.identifier
@@ -3,13 +3,9 @@
 from __future__ import absolute_import
 
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class PermissionableResourceType(str, Enum):
     """Represents resource types that a user can be granted permissions to."""
@@ -33,12 +29,3 @@ class ResourceTypePermissions(_BaseEvergreenObject):
 
     resource_type = evg_attrib("type")
     permissions = evg_attrib("permissions")
-
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a resource type permission set.
-
-        :param json: JSON of resource type permissions.
-        :param api: Evergreen API.
-        """
-        super(ResourceTypePermissions, self).__init__(json, api)
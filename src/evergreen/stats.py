@@ -2,13 +2,8 @@
 """Stats representation of evergreen."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Dict
-
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_date_attrib
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class TestStats(_BaseEvergreenObject):
     """Representation of an Evergreen test stats object."""
@@ -23,14 +18,6 @@ class TestStats(_BaseEvergreenObject):
     num_fail = evg_attrib("num_fail")
     avg_duration_pass = evg_attrib("avg_duration_pass")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a test stats object.
-
-        :param json: json version of object.
-        """
-        super(TestStats, self).__init__(json, api)
-
 
 class TaskStats(_BaseEvergreenObject):
     """Representation of an Evergreen task stats object."""
@@ -43,11 +30,3 @@ class TaskStats(_BaseEvergreenObject):
     num_fail = evg_attrib("num_failed")
     num_total = evg_attrib("num_total")
     avg_duration_pass = evg_attrib("avg_duration_success")
-
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a test stats object.
-
-        :param json: json version of object.
-        """
-        super(TaskStats, self).__init__(json, api)
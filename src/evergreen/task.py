@@ -38,10 +38,6 @@ class Artifact(_BaseEvergreenObject):
     ignore_for_fetch = evg_attrib("ignore_for_fetch")
     content_type = evg_attrib("content_type")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of an evergreen task artifact."""
-        super(Artifact, self).__init__(json, api)
-
     def stream(
         self,
         decode_unicode: bool = True,
@@ -106,10 +102,6 @@ class OomTrackerInfo(_BaseEvergreenObject):
     detected = evg_attrib("detected")
     pids = evg_attrib("pids")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of an evergreen task OOM Tracker Info."""
-        super(OomTrackerInfo, self).__init__(json, api)
-
 
 class StatusDetails(_BaseEvergreenObject):
     """Representation of a task status details from evergreen."""
@@ -119,10 +111,6 @@ class StatusDetails(_BaseEvergreenObject):
     desc = evg_attrib("desc")
     timed_out = evg_attrib("timed_out")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of an evergreen task status details."""
-        super(StatusDetails, self).__init__(json, api)
-
     @property
     def oom_tracker_info(self) -> OomTrackerInfo:
         """
@@ -136,6 +124,8 @@ class StatusDetails(_BaseEvergreenObject):
 class Task(_BaseEvergreenObject):
     """Representation of an Evergreen task."""
 
+    __slots__ = ("_logs_map",)
+
     activated = evg_attrib("activated")
     activated_by = evg_attrib("activated_by")
     build_id = evg_attrib("build_id")
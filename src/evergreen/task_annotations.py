@@ -1,11 +1,8 @@
 """Models to working with task annotations."""
-from typing import TYPE_CHECKING, Any, Dict, List
+from typing import Any, Dict, List
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class Source(_BaseEvergreenObject):
     """Source of where an annotation was generated."""
@@ -14,10 +11,6 @@ class Source(_BaseEvergreenObject):
     time = evg_datetime_attrib("time")
     requester = evg_attrib("requester")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a task annotation source."""
-        super().__init__(json, api)
-
 
 class IssueLink(_BaseEvergreenObject):
     """Representation of a issue added as a task annotation."""
@@ -25,10 +18,6 @@ class IssueLink(_BaseEvergreenObject):
     url = evg_attrib("url")
     issue_key = evg_attrib("issue_key")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a task annotation issue link."""
-        super().__init__(json, api)
-
     @property
     def source(self) -> Source:
         """Get the source of this issue link."""
@@ -40,10 +29,6 @@ class Note(_BaseEvergreenObject):
 
     message = evg_attrib("message")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a task annotation note."""
-        super().__init__(json, api)
-
     @property
     def source(self) -> Source:
         """Get the source of this note."""
@@ -56,10 +41,6 @@ class MetadataLink(_BaseEvergreenObject):
     url = evg_attrib("url")
     text = evg_attrib("text")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a task annotation metadata link."""
-        super().__init__(json, api)
-
     @property
     def source(self) -> Source:
         """Get the source of this metadata link."""
@@ -72,10 +53,6 @@ class TaskAnnotation(_BaseEvergreenObject):
     task_id = evg_attrib("task_id")
     task_execution = evg_attrib("task_execution")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a task annotations."""
-        super().__init__(json, api)
-
     @property
     def issues(self) -> List[IssueLink]:
         """Get the issues this task has been annotated with."""
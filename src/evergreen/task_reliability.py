@@ -2,13 +2,8 @@
 """Stats representation of evergreen."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Dict
-
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_date_attrib
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class TaskReliability(_BaseEvergreenObject):
     """Representation of an Evergreen task reliability object."""
@@ -27,11 +22,3 @@ class TaskReliability(_BaseEvergreenObject):
     num_setup_failed = evg_attrib("num_setup_failed")
     avg_duration_pass = evg_attrib("avg_duration_pass")
     success_rate = evg_attrib("success_rate")
-
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """
-        Create an instance of a test stats object.
-
-        :param json: json version of object.
-        """
-        super(TaskReliability, self).__init__(json, api)
@@ -2,13 +2,10 @@
 """Test representation of evergreen."""
 from __future__ import absolute_import
 
-from typing import TYPE_CHECKING, Any, Dict, Iterable
+from typing import Iterable
 
 from evergreen.base import _BaseEvergreenObject, evg_attrib, evg_datetime_attrib
 
-if TYPE_CHECKING:
-    from evergreen.api import EvergreenApi
-
 
 class Logs(_BaseEvergreenObject):
     """Representation of test logs from evergreen."""
@@ -20,10 +17,6 @@ class Logs(_BaseEvergreenObject):
     url_parsley = evg_attrib("url_parsley")
     log_id = evg_attrib("log_id")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a Test log."""
-        super(Logs, self).__init__(json, api)
-
     def stream(self) -> Iterable[str]:
         """
         Retrieve an iterator of the streamed contents of this log.
@@ -43,10 +36,6 @@ class Tst(_BaseEvergreenObject):
     start_time = evg_datetime_attrib("start_time")
     end_time = evg_datetime_attrib("end_time")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a Test object."""
-        super(Tst, self).__init__(json, api)
-
     @property
     def logs(self) -> Logs:
         """
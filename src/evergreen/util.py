@@ -3,6 +3,7 @@ from datetime import date, datetime
 from typing import Any, Iterable, Optional
 
 from dateutil.parser import parse
+from dateutil.tz import tzutc
 
 EVG_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
 EVG_SHORT_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
@@ -23,6 +24,16 @@ def parse_evergreen_datetime(evg_date: Optional[Any]) -> Optional[datetime]:
     if type(evg_date) in [int, float]:
         return datetime.fromtimestamp(evg_date)
 
+    # Evergreen sends ISO 8601 UTC timestamps, which datetime can parse far faster than dateutil.
+    if isinstance(evg_date, str) and evg_date.endswith("Z"):
+        try:
+            parsed = datetime.fromisoformat(evg_date[:-1])
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                return parsed.replace(tzinfo=tzutc())
+
     return parse(evg_date)
 
 
@@ -73,10 +73,6 @@ class BuildVariantStatus(_BaseEvergreenObject):
     build_variant = evg_attrib("build_variant")
     build_id = evg_attrib("build_id")
 
-    def __init__(self, json: Dict[str, Any], api: "EvergreenApi") -> None:
-        """Create an instance of a Build Variants status."""
-        super(BuildVariantStatus, self).__init__(json, api)
-
     def get_build(self) -> "Build":
         """Get the build object for this build variants status."""
         return self._api.build_by_id(self.build_id)
@@ -85,6 +81,8 @@ class BuildVariantStatus(_BaseEvergreenObject):
 class Version(_BaseEvergreenObject):
     """Representation of an Evergreen Version."""
 
+    __slots__ = ("build_variants_map",)
+
     version_id = evg_attrib("version_id")
     create_time = evg_datetime_attrib("create_time")
     start_time = evg_datetime_attrib("start_time")
@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 from copy import deepcopy
 from datetime import datetime, timedelta
 from http import HTTPStatus
@@ -60,6 +61,7 @@ class TestRaiseForStatus(object):
     )
     def test_non_json_error(self, mocked_api):
         mocked_response = MagicMock()
+        mocked_response.headers = {"Content-Type": "application/json"}
         mocked_response.json.side_effect = JSONDecodeError("json error", "", 0)
         mocked_response.status_code = 500
         mocked_response.raise_for_status.side_effect = HTTPError()
@@ -73,6 +75,7 @@ class TestRaiseForStatus(object):
     def test_json_errors_are_passed_through(self, mocked_api):
         error_msg = "the error"
         mocked_response = MagicMock()
+        mocked_response.headers = {"Content-Type": "application/json; charset=utf-8"}
         mocked_response.json.return_value = {"error": error_msg}
         mocked_response.status_code = 500
         mocked_response.raise_for_status.side_effect = HTTPError()
@@ -84,6 +87,178 @@ class TestRaiseForStatus(object):
         assert error_msg in str(excinfo.value)
         mocked_response.raise_for_status.assert_not_called()
 
+    def test_successful_responses_are_not_decoded(self, mocked_api):
+        mocked_response = MagicMock()
+        mocked_response.status_code = 200
+        mocked_api.session.request.return_value = mocked_response
+
+        mocked_api._call_api("http://url")
+
+        mocked_response.json.assert_not_called()
+        mocked_response.raise_for_status.assert_not_called()
+
+    def test_non_json_error_responses_are_not_decoded(self, mocked_api):
+        mocked_response = MagicMock()
+        mocked_response.headers = {"Content-Type": "text/html"}
+        mocked_response.status_code = 502
+        mocked_response.raise_for_status.side_effect = HTTPError()
+        mocked_api.session.request.return_value = mocked_response
+
+        with pytest.raises(HTTPError):
+            mocked_api._call_api("http://url")
+
+        mocked_response.json.assert_not_called()
+        mocked_response.raise_for_status.assert_called_once()
+
+
+class TestPagination(object):
+    def test_all_pages_are_combined(self, mocked_api):
+        first_page = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        first_page.json.return_value = ["item 1", "item 2"]
+        last_page = MagicMock(links={})
+        last_page.json.return_value = ["item 3"]
+        mocked_api._call_api = MagicMock(side_effect=[first_page, last_page])
+
+        results = mocked_api._paginate("http://url")
+
+        assert results == ["item 1", "item 2", "item 3"]
+
+    def test_each_page_is_decoded_once(self, mocked_api):
+        first_page = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        first_page.json.return_value = ["item 1"]
+        last_page = MagicMock(links={})
+        last_page.json.return_value = ["item 2"]
+        mocked_api._call_api = MagicMock(side_effect=[first_page, last_page])
+
+        mocked_api._paginate("http://url")
+
+        first_page.json.assert_called_once()
+        last_page.json.assert_called_once()
+
+    def test_single_object_is_returned(self, mocked_api):
+        response = MagicMock(links={})
+        response.json.return_value = {"id": "object id"}
+        mocked_api._call_api = MagicMock(return_value=response)
+
+        assert mocked_api._paginate("http://url") == {"id": "object id"}
+
+    @patch(ns("_prefetch"))
+    def test_next_page_is_requested_before_current_page_is_decoded(self, prefetch_mock, mocked_api):
+        first_page = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        first_page.json.side_effect = lambda: prefetch_mock.assert_called_once() or ["1"]
+        last_page = MagicMock(links={})
+        last_page.json.return_value = ["2"]
+        mocked_api._call_api = MagicMock(return_value=first_page)
+        prefetch_mock.return_value.result.return_value = last_page
+
+        results = mocked_api._paginate("http://url")
+
+        assert results == ["1", "2"]
+        prefetch_mock.assert_called_once_with(mocked_api._call_api, "http://url_to_next", None)
+
+    def test_pages_past_the_limit_are_not_requested(self, mocked_api):
+        first_page = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        first_page.json.return_value = ["item 1", "item 2"]
+        mocked_api._call_api = MagicMock(return_value=first_page)
+
+        results = mocked_api._paginate("http://url", {"limit": 2})
+
+        assert results == ["item 1", "item 2"]
+        mocked_api._call_api.assert_called_once_with("http://url", {"limit": 2})
+
+    def test_pages_are_requested_until_the_limit_is_reached(self, mocked_api):
+        pages = []
+        for i in range(3):
+            page = MagicMock(links={"next": {"url": f"http://url_to_page_{i + 1}"}})
+            page.json.return_value = [f"item {i}.1", f"item {i}.2"]
+            pages.append(page)
+        mocked_api._call_api = MagicMock(side_effect=pages)
+
+        results = mocked_api._paginate("http://url", {"limit": 3})
+
+        assert results == ["item 0.1", "item 0.2", "item 1.1", "item 1.2"]
+        assert mocked_api._call_api.call_count == 2
+
+    def test_page_size_does_not_limit_results(self, mocked_api):
+        first_page = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        first_page.json.return_value = ["item 1", "item 2"]
+        last_page = MagicMock(links={})
+        last_page.json.return_value = ["item 3"]
+        mocked_api._call_api = MagicMock(side_effect=[first_page, last_page])
+
+        results = mocked_api._paginate("http://url", {"status": "running"}, page_size=2)
+
+        assert results == ["item 1", "item 2", "item 3"]
+        mocked_api._call_api.assert_any_call("http://url", {"status": "running", "limit": 2})
+
+    def test_limit_takes_precedence_over_page_size(self, mocked_api):
+        response = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        response.json.return_value = ["item 1"]
+        mocked_api._call_api = MagicMock(return_value=response)
+
+        results = mocked_api._paginate("http://url", {"limit": 1}, page_size=1000)
+
+        assert results == ["item 1"]
+        mocked_api._call_api.assert_called_once_with("http://url", {"limit": 1})
+
+    def test_all_pages_share_a_session(self):
+        first_page = MagicMock(status_code=200, links={"next": {"url": "http://url_to_next"}})
+        first_page.json.return_value = ["item 1"]
+        last_page = MagicMock(status_code=200, links={})
+        last_page.json.return_value = ["item 2"]
+        session = MagicMock()
+        session.request.side_effect = [first_page, last_page]
+        evg_api = under_test.EvergreenApi()
+        evg_api._create_session = MagicMock(return_value=session)
+
+        results = evg_api._paginate("http://url")
+
+        assert results == ["item 1", "item 2"]
+        evg_api._create_session.assert_called_once()
+        session.close.assert_called_once()
+        assert evg_api._session is None
+
+    def test_session_is_closed_when_a_page_cannot_be_decoded(self):
+        first_page = MagicMock(status_code=200, links={"next": {"url": "http://url_to_next"}})
+        first_page.json.side_effect = JSONDecodeError("Expecting value", "<html>", 0)
+        session = MagicMock()
+        session.request.return_value = first_page
+        evg_api = under_test.EvergreenApi()
+        evg_api._create_session = MagicMock(return_value=session)
+
+        with pytest.raises(JSONDecodeError):
+            evg_api._paginate("http://url", {"limit": 1})
+
+        session.close.assert_called_once()
+
+
+class TestPrefetch(object):
+    def test_result_is_returned(self):
+        assert under_test._prefetch(lambda a, b: a + b, 1, 2).result(timeout=5) == 3
+
+    def test_errors_are_raised(self):
+        def fail():
+            raise HTTPError()
+
+        with pytest.raises(HTTPError):
+            under_test._prefetch(fail).result(timeout=5)
+
+    def test_does_not_block_interpreter_exit(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def wait():
+            started.set()
+            release.wait(5)
+
+        under_test._prefetch(wait)
+        started.wait(5)
+        prefetch_threads = [t for t in threading.enumerate() if t.name == "evergreen-prefetch"]
+        release.set()
+
+        assert prefetch_threads
+        assert all(thread.daemon for thread in prefetch_threads)
+
 
 class TestLazyPagination(object):
     def test_with_no_next(self, mocked_api):
@@ -115,6 +290,20 @@ class TestLazyPagination(object):
 
         assert i > items_to_check
 
+    def test_next_page_is_not_requested_until_the_page_is_consumed(self, mocked_api):
+        first_page = MagicMock(links={"next": {"url": "http://url_to_next"}})
+        first_page.json.return_value = ["item 1", "item 2"]
+        last_page = MagicMock(links={})
+        last_page.json.return_value = ["item 3"]
+        mocked_api._call_api = MagicMock(side_effect=[first_page, last_page])
+
+        results = mocked_api._lazy_paginate("http://url")
+        first_results = [next(results), next(results)]
+
+        mocked_api._call_api.assert_called_once()
+        assert first_results + list(results) == ["item 1", "item 2", "item 3"]
+        assert mocked_api._call_api.call_count == 2
+
 
 class TestSessions(object):
     def test_session_can_be_created(self):
@@ -137,6 +326,14 @@ class TestSessions(object):
             assert session_instance_one == session_instance_two
             assert original_evg_api.session != evg_api_with_session.session
 
+    def test_session_uses_a_sized_connection_pool(self):
+        evg_api = under_test.EvergreenApi()
+
+        adapter = evg_api.session.get_adapter(evg_api._api_server)
+
+        assert adapter._pool_connections == under_test.POOL_CONNECTIONS
+        assert adapter._pool_maxsize == under_test.POOL_MAXSIZE
+
 
 class TestDistrosApi(object):
     def test_all_distros(self, mocked_api):
@@ -154,14 +351,48 @@ class TestHostApi(object):
     def test_all_hosts(self, mocked_api):
         mocked_api.all_hosts()
         mocked_api.session.request.assert_called_with(
-            url=mocked_api._create_url("/hosts"), params={}, timeout=None, data=None, method="GET"
+            url=mocked_api._create_url("/hosts"),
+            params={"limit": under_test.DEFAULT_PAGE_SIZE},
+            timeout=None,
+            data=None,
+            method="GET",
         )
 
     def test_all_hosts_with_status(self, mocked_api):
         mocked_api.all_hosts(status="success")
         mocked_api.session.request.assert_called_with(
             url=mocked_api._create_url("/hosts"),
-            params={"status": "success"},
+            params={"status": "success", "limit": under_test.DEFAULT_PAGE_SIZE},
+            timeout=None,
+            data=None,
+            method="GET",
+        )
+
+    def test_all_hosts_iter(self, mocked_api, mocked_api_response, sample_host):
+        mocked_api_response.json.return_value = [sample_host]
+        mocked_api_response.links = {}
+
+        hosts = list(mocked_api.all_hosts_iter())
+
+        assert len(hosts) == 1
+        assert hosts[0].host_id == sample_host["host_id"]
+        mocked_api.session.request.assert_called_with(
+            url=mocked_api._create_url("/hosts"),
+            params={"limit": under_test.DEFAULT_PAGE_SIZE},
+            timeout=None,
+            data=None,
+            method="GET",
+        )
+
+    def test_all_hosts_iter_with_status(self, mocked_api, mocked_api_response):
+        mocked_api_response.json.return_value = []
+        mocked_api_response.links = {}
+
+        list(mocked_api.all_hosts_iter(status="running"))
+
+        mocked_api.session.request.assert_called_with(
+            url=mocked_api._create_url("/hosts"),
+            params={"limit": under_test.DEFAULT_PAGE_SIZE, "status": "running"},
             timeout=None,
             data=None,
             method="GET",
@@ -173,7 +404,11 @@ class TestProjectApi(object):
         mocked_api.all_projects()
         expected_url = mocked_api._create_url("/projects")
         mocked_api.session.request.assert_called_with(
-            url=expected_url, params=None, timeout=None, data=None, method="GET"
+            url=expected_url,
+            params={"limit": under_test.DEFAULT_PAGE_SIZE},
+            timeout=None,
+            data=None,
+            method="GET",
         )
 
     def test_all_projects_with_filter(self, mocked_api, mocked_api_response, sample_projects):
@@ -494,6 +729,55 @@ class TestBuildApi(object):
             url=expected_url, params={}, timeout=None, data=None, method="GET"
         )
 
+    def test_builds_by_ids(self, mocked_api, mocked_api_response, sample_build):
+        mocked_api_response.json.return_value = sample_build
+
+        builds = mocked_api.builds_by_ids(["1", "2", "3"])
+
+        assert [build.id for build in builds] == [sample_build["_id"]] * 3
+        assert all(build._api is mocked_api for build in builds)
+        requested_urls = {call.kwargs["url"] for call in mocked_api.session.request.call_args_list}
+        assert requested_urls == {mocked_api._create_url(f"/builds/{i}") for i in "123"}
+
+    def test_builds_by_ids_raises_errors(self, mocked_api):
+        mocked_api.session.request.side_effect = HTTPError()
+
+        with pytest.raises(HTTPError):
+            mocked_api.builds_by_ids(["1", "2"])
+
+    def test_builds_by_ids_share_a_session(self, sample_build):
+        response = MagicMock(status_code=200, links={})
+        response.json.return_value = sample_build
+        session = MagicMock()
+        session.request.return_value = response
+        evg_api = under_test.EvergreenApi()
+        evg_api._create_session = MagicMock(return_value=session)
+
+        builds = evg_api.builds_by_ids(["1", "2", "3"])
+
+        assert len(builds) == 3
+        assert all(build._api is evg_api for build in builds)
+        assert session.request.call_count == 3
+        evg_api._create_session.assert_called_once()
+        session.close.assert_called_once()
+        assert evg_api._session is None
+
+    def test_tasks_by_build_ids(self, mocked_api, mocked_api_response, sample_task):
+        mocked_api_response.json.return_value = [sample_task]
+
+        task_lists = mocked_api.tasks_by_build_ids(["1", "2"], fetch_all_executions=True)
+
+        assert [len(tasks) for tasks in task_lists] == [1, 1]
+        assert task_lists[0][0].task_id == sample_task["task_id"]
+        assert task_lists[0][0]._api is mocked_api
+        mocked_api.session.request.assert_any_call(
+            url=mocked_api._create_url("/builds/2/tasks"),
+            params={"fetch_all_executions": 1},
+            timeout=None,
+            data=None,
+            method="GET",
+        )
+
 
 class TestVersionApi(object):
     def test_version_by_id(self, mocked_api):
@@ -510,6 +794,15 @@ class TestVersionApi(object):
             url=expected_url, params=None, timeout=None, data=None, method="GET"
         )
 
+    def test_versions_by_ids(self, mocked_api, mocked_api_response, sample_version):
+        mocked_api_response.json.return_value = sample_version
+
+        versions = mocked_api.versions_by_ids(["version 1", "version 2"])
+
+        assert [version.version_id for version in versions] == [sample_version["version_id"]] * 2
+        assert all(version._api is mocked_api for version in versions)
+        assert mocked_api.session.request.call_count == 2
+
 
 class TestPatchApi(object):
     def test_patch_by_id(self, mocked_api):
@@ -1063,6 +1356,144 @@ class TestCachedEvergreenApi(object):
         assert mocked_cached_api.session.request.call_count == 4
 
 
+def _build_response(status_code, content=b"", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.raw = MagicMock()
+    response.headers.update({"Content-Type": "application/json", **(headers or {})})
+    return response
+
+
+REST_URL = "http://url/rest/v2"
+
+
+class TestETagCachingAdapter(object):
+    def _send(self, adapter, url=f"{REST_URL}/builds/build_id", method="GET"):
+        request = requests.Request(method, url).prepare()
+        return request, adapter.send(request)
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_unchanged_response_is_served_from_cache(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        send_mock.side_effect = [
+            _build_response(200, b'{"id": "build_id"}', {"ETag": '"v1"'}),
+            _build_response(304),
+        ]
+
+        self._send(adapter)
+        request, response = self._send(adapter)
+
+        assert request.headers["If-None-Match"] == '"v1"'
+        assert response.status_code == 200
+        assert response.json() == {"id": "build_id"}
+        assert response.request is request
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_changed_response_replaces_cached_response(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        send_mock.side_effect = [
+            _build_response(200, b'{"id": "v1"}', {"ETag": '"v1"'}),
+            _build_response(200, b'{"id": "v2"}', {"ETag": '"v2"'}),
+            _build_response(304),
+        ]
+
+        self._send(adapter)
+        _, changed_response = self._send(adapter)
+        request, response = self._send(adapter)
+
+        assert changed_response.json() == {"id": "v2"}
+        assert request.headers["If-None-Match"] == '"v2"'
+        assert response.json() == {"id": "v2"}
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_responses_without_etag_are_not_cached(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        send_mock.return_value = _build_response(200, b"{}")
+
+        self._send(adapter)
+        request, _ = self._send(adapter)
+
+        assert "If-None-Match" not in request.headers
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_non_json_responses_are_not_cached(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        send_mock.return_value = _build_response(
+            200, b"task log", {"ETag": '"v1"', "Content-Type": "text/plain"}
+        )
+
+        self._send(adapter)
+
+        assert cache.get(f"{REST_URL}/builds/build_id") is None
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_responses_outside_the_rest_api_are_not_cached(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        send_mock.return_value = _build_response(200, b"{}", {"ETag": '"v1"'})
+
+        self._send(adapter, url="http://url/task_log_raw/task_id/0")
+
+        assert cache.get("http://url/task_log_raw/task_id/0") is None
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_non_get_requests_are_not_cached(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        send_mock.return_value = _build_response(200, b"{}", {"ETag": '"v1"'})
+
+        self._send(adapter, method="POST")
+
+        assert cache.get(f"{REST_URL}/builds/build_id") is None
+
+    @patch("requests.adapters.HTTPAdapter.send")
+    def test_cache_does_not_keep_responses(self, send_mock):
+        cache = under_test._ETagCache(10)
+        adapter = under_test._ETagCachingAdapter(cache, REST_URL)
+        sent_response = _build_response(200, b'{"id": "build_id"}', {"ETag": '"v1"'})
+        sent_response.connection = adapter
+        send_mock.side_effect = [sent_response, _build_response(304), _build_response(304)]
+
+        self._send(adapter)
+        _, first_cached = self._send(adapter)
+        _, second_cached = self._send(adapter)
+
+        cached = cache.get(f"{REST_URL}/builds/build_id")
+        assert not isinstance(cached, requests.Response)
+        assert cached.content == b'{"id": "build_id"}'
+        assert first_cached is not second_cached
+        assert first_cached.raw is None
+        assert getattr(first_cached, "connection", None) is None
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = under_test._ETagCache(2)
+        entry = under_test._CachedResponse.from_response(
+            _build_response(200, b"{}", {"ETag": '"v1"'})
+        )
+        cache.put("url 1", entry)
+        cache.put("url 2", entry)
+        cache.get("url 1")
+        cache.put("url 3", entry)
+
+        assert cache.get("url 1") is not None
+        assert cache.get("url 2") is None
+        assert cache.get("url 3") is not None
+
+    def test_cached_api_sessions_use_etag_cache(self):
+        evg_api = under_test.CachedEvergreenApi()
+
+        adapter = evg_api.session.get_adapter(evg_api._api_server)
+
+        assert isinstance(adapter, under_test._ETagCachingAdapter)
+        assert adapter._cache is evg_api._etag_cache
+        assert adapter._url_prefix == evg_api._rest_base_url
+
+
 class TestRetryingEvergreenApi(object):
     def test_no_retries_on_success(self, mocked_retrying_api):
         version_id = "version id"
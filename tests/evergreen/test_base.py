@@ -1,7 +1,10 @@
 import pickle
+import weakref
 from copy import copy
 
 from evergreen.base import _BaseEvergreenObject
+from evergreen.host import Host
+from evergreen.task import Task
 
 
 class TestPickleSupport(object):
@@ -12,3 +15,28 @@ class TestPickleSupport(object):
         dump = pickle.dumps(task)
         unpickled = pickle.loads(dump)
         assert unpickled == original
+
+    def test_can_pickle_slotted_subclass(self, sample_task):
+        original = Task(sample_task, None)
+        unpickled = pickle.loads(pickle.dumps(copy(original)))
+        assert unpickled == original
+        assert unpickled.task_id == original.task_id
+
+    def test_can_unpickle_state_from_before_slots(self, sample_task):
+        original = Task(sample_task, None)
+        task = Task.__new__(Task)
+
+        task.__setstate__({"json": sample_task, "_api": None, "_date_fields": None})
+
+        assert task == original
+        assert task.task_id == original.task_id
+
+
+class TestSlots(object):
+    def test_common_objects_have_no_instance_dict(self, sample_task, sample_host):
+        assert not hasattr(Task(sample_task, None), "__dict__")
+        assert not hasattr(Host(sample_host, None), "__dict__")
+
+    def test_slotted_objects_support_weak_references(self, sample_task):
+        task = Task(sample_task, None)
+        assert weakref.ref(task)() is task
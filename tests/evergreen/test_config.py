@@ -0,0 +1,62 @@
+import os
+
+import evergreen.config as under_test
+
+
+class TestReadEvergreenFromFile(object):
+    def test_config_is_read(self, tmp_path):
+        config_file = tmp_path / "evergreen.yml"
+        config_file.write_text('user: "evergreen_user"\napi_key: "evergreen_api_key"\n')
+
+        config = under_test.read_evergreen_from_file(str(config_file))
+
+        assert config == {"user": "evergreen_user", "api_key": "evergreen_api_key"}
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path, monkeypatch):
+        config_file = tmp_path / "evergreen.yml"
+        config_file.write_text('user: "evergreen_user"\n')
+        under_test.read_evergreen_from_file(str(config_file))
+
+        def fail_parse(*args, **kwargs):
+            raise AssertionError("config should have come from the cache")
+
+        monkeypatch.setattr(under_test, "_load_yaml", fail_parse)
+
+        assert under_test.read_evergreen_from_file(str(config_file)) == {"user": "evergreen_user"}
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        config_file = tmp_path / "evergreen.yml"
+        config_file.write_text('user: "evergreen_user"\n')
+        under_test.read_evergreen_from_file(str(config_file))
+
+        config_file.write_text('user: "another_user"\n')
+        stat = os.stat(config_file)
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert under_test.read_evergreen_from_file(str(config_file)) == {"user": "another_user"}
+
+    def test_cached_config_cannot_be_modified_by_callers(self, tmp_path):
+        config_file = tmp_path / "evergreen.yml"
+        config_file.write_text('user: "evergreen_user"\n')
+
+        config = under_test.read_evergreen_from_file(str(config_file))
+        config["user"] = "modified"
+
+        assert under_test.read_evergreen_from_file(str(config_file)) == {"user": "evergreen_user"}
+
+
+class TestReadEvergreenConfig(object):
+    def test_first_existing_location_is_used(self, tmp_path, monkeypatch):
+        missing_file = tmp_path / "missing.yml"
+        config_file = tmp_path / "evergreen.yml"
+        config_file.write_text('user: "evergreen_user"\n')
+        monkeypatch.setattr(
+            under_test, "CONFIG_FILE_LOCATIONS", [str(missing_file), str(config_file)]
+        )
+
+        assert under_test.read_evergreen_config() == {"user": "evergreen_user"}
+
+    def test_no_config_found(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(under_test, "CONFIG_FILE_LOCATIONS", [str(tmp_path / "missing.yml")])
+
+        assert under_test.read_evergreen_config() is None
@@ -2,6 +2,9 @@ import time
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock
 
+import pytest
+from dateutil.parser import parse
+
 import evergreen.util as under_test
 
 
@@ -31,6 +34,24 @@ class TestParseEvergreenDateTime(object):
     def test_no_milliseconds_evergreen_format(self):
         assert isinstance(under_test.parse_evergreen_datetime("2019-02-13T14:55:37Z"), datetime)
 
+    @pytest.mark.parametrize(
+        "evg_date",
+        [
+            "2019-02-13T14:55:37.000Z",
+            "2019-02-13T14:55:37.625Z",
+            "2019-02-13T14:55:37.123456Z",
+            "2019-02-13T14:55:37Z",
+            "2019-02-13T14:55:37.123456789Z",
+            "2019-02-13T14:55:37+05:00",
+            "2019-02-13 14:55:37",
+        ],
+    )
+    def test_matches_dateutil(self, evg_date):
+        parsed = under_test.parse_evergreen_datetime(evg_date)
+
+        assert parsed == parse(evg_date)
+        assert parsed.utcoffset() == parse(evg_date).utcoffset()
+
 
 class TestFormatEvergreenDatetime(object):
     def test_date_is_formatted(self):